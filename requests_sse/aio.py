@@ -0,0 +1,322 @@
+"""asyncio support, based on `httpx <https://www.python-httpx.org/>`__.
+
+This module requires the ``async`` extra, install it with ``pip install requests-sse[async]``.
+:func:`install_uvloop` also requires the ``uvloop`` extra.
+"""
+
+import asyncio
+import logging
+from datetime import timedelta
+from typing import AsyncGenerator, Awaitable, Callable, Optional
+
+import httpx
+
+from .client import (
+    DEFAULT_MAX_CONNECT_RETRY,
+    DEFAULT_MAX_RECONNECTION_TIME,
+    DEFAULT_RECONNECTION_TIME,
+    InvalidContentTypeError,
+    InvalidStatusCodeError,
+    MessageEvent,
+    ReadyState,
+    _check_response,
+    _EventSourceBase,
+    _get_origin,
+)
+
+__all__ = ["AsyncEventSource", "install_uvloop"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AsyncEventSource(_EventSourceBase):
+    """Represents EventSource Interface as an asynchronous context manager.
+
+    An example::
+
+        import asyncio
+
+        import httpx
+        from requests_sse import InvalidStatusCodeError, InvalidContentTypeError
+        from requests_sse.aio import AsyncEventSource
+
+        async def main():
+            async with AsyncEventSource("https://stream.wikimedia.org/v2/stream/recentchange", timeout=30) as event_source:
+                try:
+                    async for event in event_source:
+                        print(event)
+                except InvalidStatusCodeError:
+                    pass
+                except InvalidContentTypeError:
+                    pass
+                except httpx.HTTPError:
+                    pass
+
+        asyncio.run(main())
+
+    See `MDN - EventSource <https://developer.mozilla.org/en-US/docs/Web/API/EventSource>`__ for more information.
+
+    :param url: specifies the URL to which to connect
+    :param method: specifies the HTTP method with which connection should be established
+    :param reconnection_time: wait time before try to reconnect in case
+        connection broken, it is doubled after each failed attempt until data
+        is received again, and the actual wait time is picked randomly between
+        zero and this value
+    :param max_connect_retry: maximum number of retries to connect
+    :param timeout: how long to wait for the server to send data before giving up,
+        see https://www.python-httpx.org/advanced/timeouts/ for more information,
+        if not, the timeout of the client is used
+    :param client: specifies a httpx.AsyncClient, if not, create
+        a default httpx.AsyncClient
+    :param on_open: event handler for open event
+    :param on_message: event handler for message event, it may be a coroutine
+        function, then it is awaited
+    :param on_error: event handler for error event
+    :param max_reconnection_time: upper bound of the reconnection time
+    :param kwargs: keyword arguments will pass to underlying httpx.AsyncClient.build_request() method,
+        except ``follow_redirects``, which is passed to httpx.AsyncClient.send(),
+        redirects are followed by default
+
+    :raises InvalidStatusCodeError: if status code is not 200
+    :raises InvalidContentTypeError: if the media type of the content type is not 'text/event-stream'
+    :raises httpx.HTTPError: if connection failed
+    """
+
+    __slots__ = (
+        "_client",
+        "_need_close_client",
+        "_response",
+        "_data_generator",
+        "_follow_redirects",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        method: str = "GET",
+        reconnection_time: timedelta = DEFAULT_RECONNECTION_TIME,
+        max_connect_retry: int = DEFAULT_MAX_CONNECT_RETRY,
+        timeout: Optional[float] = None,
+        client: Optional[httpx.AsyncClient] = None,
+        on_open: Optional[Callable[[], None]] = None,
+        on_message: Optional[
+            Callable[[MessageEvent], Optional[Awaitable[None]]]
+        ] = None,
+        on_error: Optional[Callable[[], None]] = None,
+        max_reconnection_time: timedelta = DEFAULT_MAX_RECONNECTION_TIME,
+        **kwargs,
+    ):
+        super().__init__(
+            url,
+            method,
+            reconnection_time,
+            max_connect_retry,
+            timeout,
+            on_open,
+            on_message,
+            on_error,
+            max_reconnection_time,
+            kwargs,
+        )
+
+        if client is not None:
+            self._client = client
+            self._need_close_client = False
+        else:
+            # like with requests, there is no timeout by default
+            self._client = httpx.AsyncClient(timeout=None)
+            self._need_close_client = True
+
+        self._response: Optional[httpx.Response] = None
+        self._data_generator: Optional[AsyncGenerator[MessageEvent, None]] = None
+        # like EventSource and browsers, follow redirects unless told otherwise
+        self._follow_redirects = self._kwargs.pop("follow_redirects", True)
+
+    async def __aenter__(self):
+        """Connect and listen Server-Sent Event."""
+        await self.connect(self._max_connect_retry)
+        return self
+
+    async def __aexit__(self, *exc):
+        """Close connection and client if needed."""
+        await self.close()
+        if self._need_close_client:
+            await self._client.aclose()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> MessageEvent:
+        """Process events"""
+        if not self._response:
+            raise ValueError("response is None")
+
+        if not self._data_generator:
+            raise ValueError("data_generator is None")
+
+        while True:
+            # close() may be called by another task at any await
+            data_generator = self._data_generator
+            if data_generator is None or self._ready_state == ReadyState.CLOSED:
+                raise StopAsyncIteration
+            try:
+                event = await data_generator.__anext__()
+            except StopAsyncIteration:
+                pass
+            except httpx.HTTPError as e:
+                if self._ready_state != ReadyState.CLOSED:
+                    _LOGGER.error("httpx exception", exc_info=e)
+            else:
+                if self._ready_state == ReadyState.CLOSED:
+                    raise StopAsyncIteration
+                if event.type == "message":
+                    result = self._on_message(event)
+                    if result is not None:
+                        await result
+                return event
+            if self._ready_state == ReadyState.CLOSED:
+                raise StopAsyncIteration
+            await self._reconnect()
+
+    async def run_forever(self) -> None:
+        """Process events until the connection is closed.
+
+        See :meth:`requests_sse.EventSource.run_forever`. To stop from
+        ``on_message``, pass a coroutine function and await :meth:`close` in it.
+        """
+        on_message = self._on_message
+        feed = self._parser.feed
+        # bound once, it is checked after every message
+        CLOSED = ReadyState.CLOSED
+        while self._ready_state != CLOSED:
+            response = self._response
+            if response is None:
+                raise ValueError("response is None")
+            chunks = response.aiter_bytes()
+            while True:
+                # only reading is guarded, errors raised by on_message propagate
+                try:
+                    chunk = await chunks.__anext__()
+                except StopAsyncIteration:
+                    break
+                except httpx.HTTPError as e:
+                    if self._ready_state != CLOSED:
+                        _LOGGER.error("httpx exception", exc_info=e)
+                    break
+                if self._ready_state == CLOSED:
+                    return
+                self._reconnect_s = self._orig_reconnect_s
+                for event in feed(chunk):
+                    if event.type == "message":
+                        result = on_message(event)
+                        if result is not None:
+                            await result
+                        if self._ready_state == CLOSED:
+                            return
+            if self._ready_state == CLOSED:
+                return
+            await self._reconnect()
+
+    async def connect(self, retry: int = 0) -> None:
+        """Connect to resource.
+
+        :param retry: how many times to retry if the request fails
+        """
+        if self._parser.last_event_id != "":
+            self._kwargs["headers"]["Last-Event-Id"] = self._parser.last_event_id
+
+        while True:
+            _LOGGER.debug(f"connect, retry={retry}")
+            try:
+                request = self._client.build_request(
+                    method=self._method,
+                    url=self.url,
+                    timeout=(
+                        httpx.USE_CLIENT_DEFAULT
+                        if self._timeout is None
+                        else self._timeout
+                    ),
+                    **self._kwargs,
+                )
+                response = await self._client.send(
+                    request, stream=True, follow_redirects=self._follow_redirects
+                )
+                break
+            except httpx.HTTPError:
+                if retry <= 0 or self._ready_state == ReadyState.CLOSED:
+                    self._fail_connect()
+                    raise
+                retry -= 1
+                self._ready_state = ReadyState.CONNECTING
+                self._on_error()
+                await self._wait_for_reconnect()
+
+        if self._ready_state == ReadyState.CLOSED:
+            # closed by another task while connecting
+            await response.aclose()
+            return
+        try:
+            _check_response(self._url, response)
+        except (InvalidStatusCodeError, InvalidContentTypeError):
+            await response.aclose()
+            self._fail_connect()
+            raise
+        # only status == 200 and media type is 'text/event-stream' can reach here
+        self._connected()
+        self._response = response
+        self._parser.reset()
+        self._parser.origin = _get_origin(response)
+        self._data_generator = self._aiter_events(response)
+
+    async def close(self) -> None:
+        """Close connection.
+
+        It may be called from another task than the one processing the events,
+        which then stops instead of reconnecting.
+        """
+        _LOGGER.debug("close")
+        self._ready_state = ReadyState.CLOSED
+        # the generator may be running in another task, it can't be closed here,
+        # closing the response ends it
+        self._data_generator = None
+        if self._response is not None:
+            response = self._response
+            self._response = None
+            await response.aclose()
+
+    async def _reconnect(self):
+        """Announce the connection is lost and reconnect."""
+        self._ready_state = ReadyState.CONNECTING
+        self._on_error()
+        await self._wait_for_reconnect()
+        if self._ready_state != ReadyState.CLOSED:
+            await self.connect(self._max_connect_retry)
+
+    async def _aiter_events(
+        self, response: httpx.Response
+    ) -> AsyncGenerator[MessageEvent, None]:
+        """Parse the response body into events."""
+        feed = self._parser.feed
+        # without chunk_size, httpx returns the data as soon as it arrives
+        async for chunk in response.aiter_bytes():
+            # the stream works, start backing off from the beginning again
+            self._reconnect_s = self._orig_reconnect_s
+            for event in feed(chunk):
+                yield event
+
+    async def _wait_for_reconnect(self):
+        """Wait before reconnecting."""
+        await asyncio.sleep(self._next_wait())
+
+
+def install_uvloop() -> None:
+    """Use `uvloop <https://github.com/MagicStack/uvloop>`__ as the event loop.
+
+    It is opt-in and has to be called before the event loop is created,
+    for example before :func:`asyncio.run`. uvloop is not available on Windows.
+
+    :raises ImportError: if uvloop is not installed
+    """
+    import uvloop
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,12 +1,14 @@
-import copy
+import http.client
 import logging
+import random
 import time
 from dataclasses import dataclass
 from datetime import timedelta
 from enum import IntEnum
-from typing import Callable, Iterator, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import requests
+from urllib3.exceptions import HTTPError
 from urllib3.util import Url, parse_url
 
 __all__ = [
@@ -18,9 +20,25 @@ __all__ = [
 ]
 
 DEFAULT_RECONNECTION_TIME = timedelta(seconds=5)
+DEFAULT_MAX_RECONNECTION_TIME = timedelta(seconds=60)
 DEFAULT_MAX_CONNECT_RETRY = 5
+_CHUNK_SIZE = 65536
+# urllib3 < 2.3 fills the whole chunk before returning, keep it small
+_FALLBACK_CHUNK_SIZE = 512
+_UTF_8_BOM = b"\xef\xbb\xbf"
 _CONTENT_TYPE_EVENT_STREAM = "text/event-stream"
-_CONTENT_TYPE_EVENT_STREAM_UTF_8 = "text/event-stream;charset=utf-8"
+# keyword arguments of requests.Session.request() and where they are used
+_REQUEST_ARGS = (
+    "params",
+    "data",
+    "headers",
+    "cookies",
+    "files",
+    "auth",
+    "hooks",
+    "json",
+)
+_SEND_ARGS = ("allow_redirects", "proxies", "verify", "cert")
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -59,6 +77,8 @@ class MessageEvent:
     See `Event types <https://javascript.info/server-sent-events#event-types>` for more information.
     """
 
+    __slots__ = ("type", "data", "origin", "last_event_id")
+
     type: Optional[str]
     """A string representing the type of event."""
     data: Optional[str]
@@ -69,7 +89,287 @@ class MessageEvent:
     """A string representing a unique ID for the event."""
 
 
-class EventSource:
+class _SSEParser:
+    """Parser of the ``text/event-stream`` format, independent of the transport.
+
+    Bytes of the response body are fed to the parser as they are received,
+    and the events dispatched by them are returned.
+
+    See `HTML Standard - Parsing an event stream <https://html.spec.whatwg.org/multipage/server-sent-events.html#parsing-an-event-stream>`__ for more information.
+    """
+
+    __slots__ = (
+        "origin",
+        "last_event_id",
+        "retry",
+        "_buf",
+        "_scan_pos",
+        "_bom_checked",
+        "_skip_lf",
+        "_event_id",
+        "_event_type",
+        "_event_data",
+    )
+
+    def __init__(self) -> None:
+        self.origin = ""
+        """The origin of the current connection, set by the transport."""
+        self.last_event_id = ""
+        """The last event ID string, sent back when reconnecting."""
+        self.retry: Optional[float] = None
+        """The reconnection time in seconds set by the last ``retry`` field."""
+
+        self._buf = bytearray()
+        # the buffered bytes before this position hold no line terminator
+        self._scan_pos = 0
+        self._bom_checked = False
+        self._skip_lf = False
+        self._event_id = ""
+        self._event_type: Optional[str] = None
+        self._event_data: Optional[List[bytes]] = None
+
+    def reset(self) -> None:
+        """Discard the pending line and event, to start reading a new stream."""
+        self._buf.clear()
+        self._scan_pos = 0
+        self._bom_checked = False
+        self._skip_lf = False
+        self._event_type = None
+        self._event_data = None
+
+    def feed(self, data: bytes) -> List[MessageEvent]:
+        """Parse a chunk of the stream and return the events it completes."""
+        buf = self._buf
+        buf.extend(data)
+        if not self._bom_checked:
+            # a leading BOM is consumed once per stream
+            if len(buf) < len(_UTF_8_BOM) and _UTF_8_BOM.startswith(buf):
+                return []
+            if buf.startswith(_UTF_8_BOM):
+                del buf[: len(_UTF_8_BOM)]
+            self._bom_checked = True
+        # wait for data to tell whether a CR at the end of the last chunk was a CRLF
+        if self._skip_lf and buf:
+            if buf[0] == 0x0A:
+                del buf[:1]
+            self._skip_lf = False
+        # bound once, they are called for every line
+        find = buf.find
+        push_line = self.push_line
+        events: List[MessageEvent] = []
+        append = events.append
+        # lines are copied out of a view, slicing the bytearray would copy twice
+        view = memoryview(buf)
+        size = len(buf)
+        # the lines before pos are consumed, they are removed at once in the end
+        # instead of moving the rest of the buffer after every line
+        pos = 0
+        scan = self._scan_pos
+        # lines end with CRLF, a single LF or a single CR, the next LF and CR are
+        # only searched again once passed, so most lines take a single find()
+        lf = find(b"\n", scan)
+        cr = find(b"\r", scan)
+        while True:
+            if 0 <= lf < scan:
+                lf = find(b"\n", scan)
+            if 0 <= cr < scan:
+                cr = find(b"\r", scan)
+            if cr != -1 and (lf == -1 or cr < lf):
+                line = view[pos:cr].tobytes()
+                if cr == size - 1:
+                    # don't wait for the next chunk to tell CR from CRLF,
+                    # drop the LF later if it turns out to be CRLF
+                    self._skip_lf = True
+                    pos = size
+                else:
+                    pos = cr + 2 if lf == cr + 1 else cr + 1
+            elif lf != -1:
+                line = view[pos:lf].tobytes()
+                pos = lf + 1
+            else:
+                break
+            scan = pos
+            event = push_line(line)
+            if event is not None:
+                append(event)
+        # the buffer can't be resized while it is viewed
+        view.release()
+        del buf[:pos]
+        # the next chunk continues the line, don't scan it again
+        self._scan_pos = size - pos
+        return events
+
+    def push_line(self, line: bytes) -> Optional[MessageEvent]:
+        """Process a line without its terminator, return the event it dispatches."""
+        if line == b"":
+            # empty line
+            return self._dispatch_event()
+
+        if line.startswith(b":"):
+            # comment line, ignore
+            return None
+
+        # a line without ':' is a field name with an empty value
+        field_name, _, field_value = line.partition(b":")
+        if field_value[:1] == b" ":
+            field_value = field_value[1:]
+        handler = self._FIELD_HANDLERS.get(field_name)
+        if handler is not None:
+            handler(self, field_value)
+        return None
+
+    def _dispatch_event(self) -> Optional[MessageEvent]:
+        """Dispatch event."""
+        self.last_event_id = self._event_id
+
+        if self._event_data is None:
+            self._event_type = None
+            return None
+
+        data = b"\n".join(self._event_data).decode("utf8", "replace")
+
+        message = MessageEvent(
+            type=self._event_type,
+            data=data,
+            origin=self.origin,
+            last_event_id=self.last_event_id,
+        )
+        _LOGGER.debug(message)
+
+        self._event_type = None
+        self._event_data = None
+        return message
+
+    def _process_event_field(self, field_value: bytes):
+        """Process the ``event`` field."""
+        self._event_type = field_value.decode("utf8", "replace")
+
+    def _process_data_field(self, field_value: bytes):
+        """Process the ``data`` field."""
+        # by default, the event type is "message"
+        if self._event_type is None:
+            self._event_type = "message"
+
+        if self._event_data is None:
+            self._event_data = [field_value]
+        else:
+            self._event_data.append(field_value)
+
+    def _process_id_field(self, field_value: bytes):
+        """Process the ``id`` field."""
+        # the id field is ignored if it contains U+0000 NULL
+        if b"\x00" not in field_value:
+            self._event_id = field_value.decode("utf8", "replace")
+
+    def _process_retry_field(self, field_value: bytes):
+        """Process the ``retry`` field."""
+        try:
+            self.retry = int(field_value) / 1000.0
+        except ValueError:
+            _LOGGER.warning("Received invalid retry value %s, ignore it", field_value)
+
+    # field name -> handler, fields with any other name are ignored
+    _FIELD_HANDLERS: Dict[bytes, Callable[["_SSEParser", bytes], None]] = {
+        b"event": _process_event_field,
+        b"data": _process_data_field,
+        b"id": _process_id_field,
+        b"retry": _process_retry_field,
+    }
+
+
+class _EventSourceBase:
+    """State, event handlers and reconnection back-off shared by the event sources.
+
+    The subclasses implement the transport and the wait before reconnecting.
+    """
+
+    __slots__ = (
+        "_url",
+        "_ready_state",
+        "_on_open",
+        "_on_message",
+        "_on_error",
+        "_reconnect_s",
+        "_orig_reconnect_s",
+        "_max_reconnect_s",
+        "_max_connect_retry",
+        "_timeout",
+        "_kwargs",
+        "_parser",
+        "_method",
+    )
+
+    def __init__(
+        self,
+        url: str,
+        method: str,
+        reconnection_time: timedelta,
+        max_connect_retry: int,
+        timeout: Optional[float],
+        on_open: Optional[Callable[[], None]],
+        on_message: Optional[Callable[[MessageEvent], Any]],
+        on_error: Optional[Callable[[], None]],
+        max_reconnection_time: timedelta,
+        kwargs: Dict[str, Any],
+    ):
+        self._url = url
+        self._ready_state = ReadyState.CONNECTING
+
+        # missing handlers are replaced with a no-op, so they are simply called
+        self._on_open = on_open or _noop
+        self._on_message = on_message or _noop
+        self._on_error = on_error or _noop
+
+        # reconnection times are kept in seconds
+        self._reconnect_s = reconnection_time.total_seconds()
+        self._orig_reconnect_s = self._reconnect_s
+        self._max_reconnect_s = max_reconnection_time.total_seconds()
+        self._max_connect_retry = max_connect_retry
+        self._timeout = timeout
+        # only the headers are modified later, so shallow copies are enough
+        self._kwargs = dict(kwargs)
+        self._kwargs["headers"] = dict(self._kwargs.get("headers") or {})
+        self._kwargs["headers"]["Accept"] = _CONTENT_TYPE_EVENT_STREAM
+        self._kwargs["headers"]["Cache-Control"] = "no-cache"
+
+        self._parser = _SSEParser()
+        self._method = method
+
+    @property
+    def url(self) -> str:
+        """Return URL to which to connect."""
+        return self._url
+
+    @property
+    def ready_state(self) -> ReadyState:
+        """Return ready state."""
+        return self._ready_state
+
+    def _connected(self):
+        """Announce the connection is made."""
+        if self._ready_state != ReadyState.CLOSED:
+            self._ready_state = ReadyState.OPEN
+            self._on_open()
+
+    def _fail_connect(self):
+        """Announce the connection is failed."""
+        if self._ready_state != ReadyState.CLOSED:
+            self._ready_state = ReadyState.CLOSED
+            self._on_error()
+
+    def _next_wait(self) -> float:
+        """Back off exponentially with full jitter, return the seconds to wait."""
+        if self._parser.retry is not None:
+            # the reconnection time was set by the server
+            self._reconnect_s = self._parser.retry
+            self._parser.retry = None
+        self._reconnect_s = min(self._reconnect_s * 2, self._max_reconnect_s)
+        wait = random.random() * self._reconnect_s
+        _LOGGER.debug("wait %s seconds for reconnect", wait)
+        return wait
+
+
+class EventSource(_EventSourceBase):
     """Represents EventSource Interface as a context manager.
 
     An example::
@@ -93,7 +393,9 @@ class EventSource:
     :param url: specifies the URL to which to connect
     :param method: specifies the HTTP method with which connection should be established
     :param reconnection_time: wait time before try to reconnect in case
-        connection broken
+        connection broken, it is doubled after each failed attempt until data
+        is received again, and the actual wait time is picked randomly between
+        zero and this value
     :param max_connect_retry: maximum number of retries to connect
     :param timeout: how long to wait for the server to send data before giving up,
         I recommend that you set a reasonable value based on actual needs, which will improve stability,
@@ -103,13 +405,23 @@ class EventSource:
     :param on_open: event handler for open event
     :param on_message: event handler for message event
     :param on_error: event handler for error event
+    :param max_reconnection_time: upper bound of the reconnection time
     :param kwargs: keyword arguments will pass to underlying requests.request() method.
 
     :raises InvalidStatusCodeError: if status code is not 200
-    :raises InvalidContentTypeError: if content type is not 'text/event-stream' or 'text/event-stream;charset=utf-8'
+    :raises InvalidContentTypeError: if the media type of the content type is not 'text/event-stream'
     :raises requests.RequestException: if connection failed
     """
 
+    __slots__ = (
+        "_session",
+        "_need_close_session",
+        "_response",
+        "_data_generator",
+        "_request",
+        "_send_kwargs",
+    )
+
     def __init__(
         self,
         url: str,
@@ -121,10 +433,21 @@ class EventSource:
         on_open: Optional[Callable[[], None]] = None,
         on_message: Optional[Callable[[MessageEvent], None]] = None,
         on_error: Optional[Callable[[], None]] = None,
+        max_reconnection_time: timedelta = DEFAULT_MAX_RECONNECTION_TIME,
         **kwargs,
     ):
-        self._url = url
-        self._ready_state = ReadyState.CONNECTING
+        super().__init__(
+            url,
+            method,
+            reconnection_time,
+            max_connect_retry,
+            timeout,
+            on_open,
+            on_message,
+            on_error,
+            max_reconnection_time,
+            kwargs,
+        )
 
         if session is not None:
             self._session = session
@@ -133,31 +456,10 @@ class EventSource:
             self._session = requests.Session()
             self._need_close_session = True
 
-        self._on_open = on_open
-        self._on_message = on_message
-        self._on_error = on_error
-
-        self._reconnection_time = reconnection_time
-        self._orginal_reconnection_time = reconnection_time
-        self._max_connect_retry = max_connect_retry
-        self._timeout = timeout
-        self._last_event_id = ""
-        self._kwargs = copy.deepcopy(kwargs)
-
-        if "headers" not in self._kwargs:
-            self._kwargs["headers"] = dict()
-        self._kwargs["headers"]["Accept"] = _CONTENT_TYPE_EVENT_STREAM
-        self._kwargs["headers"]["Cache-Control"] = "no-cache"
-
-        self._event_id = ""
-        self._event_type = None
-        self._event_data = None
-
-        self._origin: Optional[str] = None
         self._response: Optional[requests.Response] = None
         self._data_generator: Optional[Iterator] = None
-
-        self._method = method
+        self._request: Optional[requests.Request] = None
+        self._send_kwargs: Dict[str, Any] = {}
 
     def __enter__(self):
         """Connect and listen Server-Sent Event."""
@@ -170,16 +472,6 @@ class EventSource:
         if self._need_close_session:
             self._session.close()
 
-    @property
-    def url(self) -> str:
-        """Return URL to which to connect."""
-        return self._url
-
-    @property
-    def ready_state(self) -> ReadyState:
-        """Return ready state."""
-        return self._ready_state
-
     def __iter__(self):
         return self
 
@@ -192,110 +484,128 @@ class EventSource:
             raise ValueError("data_generator is None")
 
         while True:
+            try:
+                event = next(self._data_generator)
+            except StopIteration:
+                pass
+            except (requests.RequestException, HTTPError) as e:
+                _LOGGER.error("requests exception", exc_info=e)
+            else:
+                if event.type == "message":
+                    self._on_message(event)
+                return event
+            self._reconnect()
+
+    def run_forever(self) -> None:
+        """Process events until the connection is closed.
+
+        Every message event is passed to ``on_message``. Instead of returning the
+        events one by one like iterating does, all the events of a chunk read from
+        the connection are dispatched at once, which is preferable when only the
+        callbacks are used. Call :meth:`close` from ``on_message`` to stop, the
+        rest of the chunk is then discarded. Exceptions raised by ``on_message``
+        are not caught.
+        """
+        on_message = self._on_message
+        feed = self._parser.feed
+        # bound once, it is checked after every message
+        CLOSED = ReadyState.CLOSED
+        while self._ready_state != CLOSED:
+            response = self._response
+            if response is None:
+                raise ValueError("response is None")
+            chunks = self._iter_chunks(response)
             while True:
+                # only reading is guarded, errors raised by on_message propagate
                 try:
-                    line_in_bytes = next(self._data_generator)
+                    chunk = next(chunks)
                 except StopIteration:
-                    self._event_type = None
-                    self._event_data = None
                     break
-                except requests.RequestException as e:
+                except (requests.RequestException, HTTPError) as e:
                     _LOGGER.error("requests exception", exc_info=e)
-                    self._event_type = None
-                    self._event_data = None
                     break
-
-                line: str = line_in_bytes.decode("utf8")
-                line = line.rstrip("\n").rstrip("\r")
-
-                if line == "":
-                    # empty line
-                    event = self._dispatch_event()
-                    if event is not None:
-                        return event
-                    continue
-
-                if line[0] == ":":
-                    # comment line, ignore
-                    continue
-
-                if ":" in line:
-                    # contains ':'
-                    fields = line.split(":", 1)
-                    field_name = fields[0]
-                    field_value = fields[1].lstrip(" ")
-                    self._process_field(field_name, field_value)
-                else:
-                    self._process_field(line, "")
-            self._ready_state = ReadyState.CONNECTING
-            if self._on_error:
-                self._on_error()
-            self._reconnection_time *= 2
-            _LOGGER.debug(
-                "wait %s seconds for reconnect", self._reconnection_time.total_seconds()
-            )
-            time.sleep(self._reconnection_time.total_seconds())
-            self.connect(self._max_connect_retry)
+                self._reconnect_s = self._orig_reconnect_s
+                for event in feed(chunk):
+                    if event.type == "message":
+                        on_message(event)
+                        if self._ready_state == CLOSED:
+                            return
+            if self._ready_state == CLOSED:
+                return
+            self._reconnect()
 
     def connect(self, retry: int = 0) -> None:
-        """Connect to resource."""
-        _LOGGER.debug(f"connect, retry={retry}")
+        """Connect to resource.
 
-        if self._last_event_id != "":
-            self._kwargs["headers"]["Last-Event-Id"] = self._last_event_id
+        :param retry: how many times to retry if the request fails
+        """
+        while True:
+            _LOGGER.debug(f"connect, retry={retry}")
+            try:
+                prepared = self._prepare_request()
+                response = self._session.send(prepared, **self._send_kwargs)
+                break
+            except requests.RequestException:
+                if retry <= 0 or self._ready_state == ReadyState.CLOSED:
+                    self._fail_connect()
+                    raise
+                retry -= 1
+                self._ready_state = ReadyState.CONNECTING
+                self._on_error()
+                self._wait_for_reconnect()
 
         try:
-            response = self._session.request(
-                method=self._method,
-                url=self.url,
-                stream=True,
-                timeout=self._timeout,
-                **self._kwargs,
-            )
+            _check_response(self._url, response)
         except requests.RequestException:
-            if retry <= 0 or self._ready_state == ReadyState.CLOSED:
-                self._fail_connect()
-                raise
-            else:
-                self._ready_state = ReadyState.CONNECTING
-                if self._on_error:
-                    self._on_error()
-                self._reconnection_time *= 2
-                _LOGGER.debug(
-                    "wait %s seconds for retry", self._reconnection_time.total_seconds()
+            response.close()
+            self._fail_connect()
+            raise
+        # only status == 200 and media type is 'text/event-stream' can reach here
+        self._connected()
+        response.raw.decode_content = True
+        self._response = response
+        self._parser.reset()
+        self._parser.origin = _get_origin(response)
+        self._data_generator = self._iter_events(response)
+
+    def _prepare_request(self) -> requests.PreparedRequest:
+        """Return the request to send.
+
+        It is prepared for every connection like requests.Session.request() does,
+        so the current authentication, headers, params, cookies and hooks of
+        the session are used, only the environment settings are merged once.
+        """
+        request = self._request
+        if request is None:
+            unexpected = set(self._kwargs) - set(_REQUEST_ARGS) - set(_SEND_ARGS)
+            if unexpected:
+                raise TypeError(
+                    "unexpected keyword arguments: {}".format(", ".join(unexpected))
                 )
-                time.sleep(self._reconnection_time.total_seconds())
-                self.connect(retry - 1)
-            return
-
-        if response.status_code != 200:
-            error_message = "fetch {} failed with wrong response status: {}".format(
-                self._url, response.status_code
+            request_kwargs = {k: self._kwargs.get(k) for k in _REQUEST_ARGS}
+            request = requests.Request(
+                method=self._method.upper(), url=self.url, **request_kwargs
             )
-            _LOGGER.error(error_message)
-            self._fail_connect()
-            raise InvalidStatusCodeError(
-                response.status_code, error_message, response=response
+            self._request = request
+            prepared = self._session.prepare_request(request)
+            settings = self._session.merge_environment_settings(
+                prepared.url,
+                self._kwargs.get("proxies") or {},
+                True,
+                self._kwargs.get("verify"),
+                self._kwargs.get("cert"),
             )
-
-        content_type = response.headers.get("Content-Type")
-        if not content_type or content_type.lower().replace(" ", "") not in (
-            _CONTENT_TYPE_EVENT_STREAM,
-            _CONTENT_TYPE_EVENT_STREAM_UTF_8,
-        ):
-            error_message = "fetch {} failed with wrong Content-Type: {}".format(
-                self._url, response.headers.get("Content-Type")
+            self._send_kwargs = dict(settings)
+            self._send_kwargs["timeout"] = self._timeout
+            self._send_kwargs["allow_redirects"] = self._kwargs.get(
+                "allow_redirects", True
             )
-            _LOGGER.error(error_message)
-            self._fail_connect()
-            raise InvalidContentTypeError(
-                content_type, error_message, response=response
-            )
-        # only status == 200 and content_type is 'text/event-stream' or 'text/event-stream;charset=utf-8' can reach here
-        self._connected()
-        self._response = response
-        self._data_generator = response.iter_lines()
-        self._origin = self._get_origin(response)
+        else:
+            prepared = self._session.prepare_request(request)
+
+        if self._parser.last_event_id != "":
+            prepared.headers["Last-Event-Id"] = self._parser.last_event_id
+        return prepared
 
     def close(self) -> None:
         """Close connection."""
@@ -306,78 +616,85 @@ class EventSource:
             self._response = None
             self._data_generator = None
 
-    def _connected(self):
-        """Announce the connection is made."""
-        if self._ready_state != ReadyState.CLOSED:
-            self._ready_state = ReadyState.OPEN
-            if self._on_open:
-                self._on_open()
-        self._reconnection_time = self._orginal_reconnection_time
-
-    def _fail_connect(self):
-        """Announce the connection is failed."""
-        if self._ready_state != ReadyState.CLOSED:
-            self._ready_state = ReadyState.CLOSED
-            if self._on_error:
-                self._on_error()
-
-    def _dispatch_event(self):
-        """Dispatch event."""
-        self._last_event_id = self._event_id
-
-        if self._event_data is None:
-            self._event_type = None
+    @staticmethod
+    def _iter_chunks(response: requests.Response) -> Iterator[bytes]:
+        """Read the response body, returning data as soon as it arrives."""
+        raw = response.raw
+        fp: Any = getattr(raw, "_fp", None)
+        encoding = response.headers.get("Content-Encoding", "identity").lower()
+        if hasattr(raw, "read1"):
+            read1 = raw.read1
+        elif hasattr(fp, "read1") and encoding in ("", "identity"):
+            # urllib3 < 2.3, nothing to decode, read the underlying
+            # http.client response, it handles the chunked transfer encoding
+            read1 = fp.read1
+        else:
+            # urllib3 < 2.3 with a compressed body, let urllib3 decode it
+            yield from response.iter_content(chunk_size=_FALLBACK_CHUNK_SIZE)
             return
+        while True:
+            try:
+                chunk = read1(_CHUNK_SIZE)
+            except (http.client.HTTPException, OSError) as e:
+                # only raised when reading http.client directly
+                raise requests.ConnectionError(e, response=response) from e
+            if not chunk:
+                return
+            yield chunk
+
+    def _reconnect(self):
+        """Announce the connection is lost and reconnect."""
+        self._ready_state = ReadyState.CONNECTING
+        self._on_error()
+        self._wait_for_reconnect()
+        self.connect(self._max_connect_retry)
 
-        self._event_data = self._event_data.rstrip("\n")
+    def _iter_events(self, response: requests.Response) -> Iterator[MessageEvent]:
+        """Parse the response body into events."""
+        feed = self._parser.feed
+        for chunk in self._iter_chunks(response):
+            # the stream works, start backing off from the beginning again
+            self._reconnect_s = self._orig_reconnect_s
+            yield from feed(chunk)
 
-        message = MessageEvent(
-            type=self._event_type,
-            data=self._event_data,
-            origin=self._origin,
-            last_event_id=self._last_event_id,
-        )
-        _LOGGER.debug(message)
-        if self._on_message and self._event_type == "message":
-            self._on_message(message)
+    def _wait_for_reconnect(self):
+        """Wait before reconnecting."""
+        time.sleep(self._next_wait())
 
-        self._event_type = None
-        self._event_data = None
-        return message
 
-    def _process_field(self, field_name, field_value):
-        """Process field."""
-        if field_name == "event":
-            self._event_type = field_value
+def _noop(*args: Any) -> None:
+    """Event handler that does nothing."""
 
-        elif field_name == "data":
-            # by default, the event type is "message"
-            if self._event_type is None:
-                self._event_type = "message"
 
-            if self._event_data is None:
-                self._event_data = field_value
-            else:
-                self._event_data += field_value
-            self._event_data += "\n"
+def _check_response(url: str, response: Any) -> None:
+    """Check that the response is an event stream.
+
+    :param url: the URL the response was fetched from
+    :param response: a response of requests or httpx, they expose the same
+        ``status_code`` and ``headers`` attributes
+    """
+    if response.status_code != 200:
+        error_message = "fetch {} failed with wrong response status: {}".format(
+            url, response.status_code
+        )
+        _LOGGER.error(error_message)
+        raise InvalidStatusCodeError(
+            response.status_code, error_message, response=response
+        )
 
-        elif field_name == "id" and field_value not in ("\u0000", "\x00\x00"):
-            self._event_id = field_value
+    content_type = response.headers.get("Content-Type")
+    # parameters such as charset are ignored
+    media_type = (content_type or "").split(";", 1)[0].strip().lower()
+    if media_type != _CONTENT_TYPE_EVENT_STREAM:
+        error_message = "fetch {} failed with wrong Content-Type: {}".format(
+            url, content_type
+        )
+        _LOGGER.error(error_message)
+        raise InvalidContentTypeError(content_type, error_message, response=response)
 
-        elif field_name == "retry":
-            try:
-                retry_in_ms = int(field_value)
-                self._reconnection_time = timedelta(milliseconds=retry_in_ms)
-            except ValueError:
-                _LOGGER.warning(
-                    "Received invalid retry value %s, ignore it", field_value
-                )
 
-    @staticmethod
-    def _get_origin(response: requests.Response) -> str:
-        """Get origin from response."""
-        url = response.history[0].url if response.history else response.url
-        parsed_url = parse_url(url)
-        return Url(
-            scheme=parsed_url.scheme, host=parsed_url.host, port=parsed_url.port
-        ).url
+def _get_origin(response: Any) -> str:
+    """Get origin from a response of requests or httpx."""
+    url = response.history[0].url if response.history else response.url
+    parsed_url = parse_url(str(url))
+    return Url(scheme=parsed_url.scheme, host=parsed_url.host, port=parsed_url.port).url
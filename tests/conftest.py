@@ -1,3 +1,17 @@
 import logging
 
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
 logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture(scope="session")
+def session():
+    """A session shared by the tests, to reuse the connections to the test server."""
+    with requests.Session() as s:
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+        s.mount("http://", adapter)
+        s.mount("https://", adapter)
+        yield s
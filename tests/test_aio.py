@@ -0,0 +1,280 @@
+"""Tests for `requests_sse.aio` module."""
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from requests_sse import (  # noqa: E402
+    InvalidContentTypeError,
+    InvalidStatusCodeError,
+    ReadyState,
+)
+from requests_sse.aio import AsyncEventSource  # noqa: E402
+
+
+def mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def stream_response(body):
+    return httpx.Response(
+        200, headers={"Content-Type": "text/event-stream"}, content=body
+    )
+
+
+def test_basic_usage():
+    """Test basic usage."""
+
+    async def collect():
+        messages = []
+        async with AsyncEventSource(
+            "https://stream.wikimedia.org/v2/stream/recentchange"
+        ) as event_source:
+            async for message in event_source:
+                if len(messages) > 1:
+                    break
+                messages.append(message)
+        return messages
+
+    messages = asyncio.run(collect())
+
+    print(messages)
+    assert messages[0].type == "message"
+    assert messages[0].origin == "https://stream.wikimedia.org"
+    assert messages[1].type == "message"
+    assert messages[1].origin == "https://stream.wikimedia.org"
+    data_0 = json.loads(messages[0].data)
+    data_1 = json.loads(messages[1].data)
+    assert data_0["meta"]["id"] != data_1["meta"]["id"]
+
+
+def test_run_forever():
+    """Test that run_forever dispatches messages until closed from on_message."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return stream_response(b"data: a\n\nevent: x\ndata: y\n\ndata: b\n\n")
+
+    async def run():
+        messages = []
+
+        async def on_message(event):
+            messages.append(event.data)
+            if len(messages) == 3:
+                await source.close()
+
+        async with mock_client(handler) as client:
+            async with AsyncEventSource(
+                "http://example.com/",
+                reconnection_time=timedelta(0),
+                client=client,
+                on_message=on_message,
+            ) as source:
+                await source.run_forever()
+        return messages, source.ready_state
+
+    messages, ready_state = asyncio.run(run())
+    assert messages == ["a", "b", "a"]
+    assert ready_state == ReadyState.CLOSED
+    assert len(requests) == 2
+
+
+def test_run_forever_callback_error():
+    """Test that errors raised by on_message are not taken for transport errors."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return stream_response(b"data: a\n\ndata: b\n\n")
+
+    async def run():
+        messages = []
+
+        def on_message(event):
+            messages.append(event.data)
+            raise httpx.ReadError("from on_message")
+
+        async with mock_client(handler) as client:
+            async with AsyncEventSource(
+                "http://example.com/",
+                reconnection_time=timedelta(0),
+                client=client,
+                on_message=on_message,
+            ) as source:
+                with pytest.raises(httpx.ReadError, match="from on_message"):
+                    await source.run_forever()
+        return messages
+
+    assert asyncio.run(run()) == ["a"]
+    assert len(requests) == 1
+
+
+def test_timeout():
+    """Test that the timeout of the client is used unless one is given."""
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return stream_response(b"data: a\n\n")
+
+    async def run(timeout):
+        client = httpx.AsyncClient(timeout=0.5, transport=httpx.MockTransport(handler))
+        async with client:
+            async with AsyncEventSource(
+                "http://example.com/", timeout=timeout, client=client
+            ):
+                pass
+
+    asyncio.run(run(None))
+    asyncio.run(run(2))
+    assert timeouts == [0.5, 2]
+
+
+def test_reconnect():
+    """Test reconnecting with the last event ID."""
+    requests = []
+    bodies = [b"id: 1\ndata: a\n\n", b"data: b\n\n"]
+    errors = []
+
+    def handler(request):
+        requests.append(request)
+        return stream_response(bodies[len(requests) - 1])
+
+    async def run():
+        events = []
+        async with mock_client(handler) as client:
+            async with AsyncEventSource(
+                "http://example.com/",
+                reconnection_time=timedelta(0),
+                client=client,
+                on_error=lambda: errors.append(source.ready_state),
+            ) as source:
+                async for event in source:
+                    events.append(event)
+                    if len(events) == 2:
+                        break
+        return events
+
+    events = asyncio.run(run())
+    assert [(e.data, e.last_event_id) for e in events] == [("a", "1"), ("b", "1")]
+    assert "Last-Event-Id" not in requests[0].headers
+    assert requests[1].headers["Last-Event-Id"] == "1"
+    assert requests[1].headers["Accept"] == "text/event-stream"
+    assert errors == [ReadyState.CONNECTING]
+
+
+@pytest.mark.parametrize(
+    "response, error",
+    [
+        (lambda: httpx.Response(404), InvalidStatusCodeError),
+        (
+            lambda: httpx.Response(200, headers={"Content-Type": "text/plain"}),
+            InvalidContentTypeError,
+        ),
+    ],
+)
+def test_rejected_response(response, error):
+    """Test that a wrong status or content type fails the connection."""
+    errors = []
+
+    async def run():
+        async with mock_client(lambda request: response()) as client:
+            source = AsyncEventSource(
+                "http://example.com/",
+                client=client,
+                on_error=lambda: errors.append(source.ready_state),
+            )
+            with pytest.raises(error):
+                await source.connect(retry=3)
+        return source
+
+    source = asyncio.run(run())
+    assert source.ready_state == ReadyState.CLOSED
+    assert errors == [ReadyState.CLOSED]
+
+
+def test_close():
+    """Test closing while iterating."""
+
+    def handler(request):
+        return stream_response(b"data: a\n\ndata: b\n\n")
+
+    async def run():
+        events = []
+        async with mock_client(handler) as client:
+            async with AsyncEventSource("http://example.com/", client=client) as source:
+                async for event in source:
+                    events.append(event.data)
+                    await source.close()
+                    break
+                assert source.ready_state == ReadyState.CLOSED
+                with pytest.raises(ValueError):
+                    await source.__anext__()
+        return events
+
+    assert asyncio.run(run()) == ["a"]
+
+
+def test_close_from_another_task():
+    """Test that closing from another task stops the iteration."""
+    requests = []
+
+    async def body():
+        yield b"data: a\n\n"
+        while True:
+            await asyncio.sleep(0.01)
+            yield b"data: b\n\n"
+
+    def handler(request):
+        requests.append(request)
+        return stream_response(body())
+
+    async def run():
+        events = []
+        received = asyncio.Event()
+
+        async def read(source):
+            async for event in source:
+                events.append(event.data)
+                received.set()
+
+        async with mock_client(handler) as client:
+            async with AsyncEventSource(
+                "http://example.com/", reconnection_time=timedelta(0), client=client
+            ) as source:
+                task = asyncio.create_task(read(source))
+                await received.wait()
+                await source.close()
+                await asyncio.wait_for(task, 1)
+        return events, source.ready_state
+
+    events, ready_state = asyncio.run(run())
+    assert events[0] == "a"
+    assert ready_state == ReadyState.CLOSED
+    assert len(requests) == 1
+
+
+def test_redirect():
+    """Test that redirects are followed unless disabled."""
+
+    def handler(request):
+        if request.url.host == "a.example.com":
+            return httpx.Response(302, headers={"Location": "http://b.example.com/"})
+        return stream_response(b"data: a\n\n")
+
+    async def run(**kwargs):
+        async with mock_client(handler) as client:
+            async with AsyncEventSource(
+                "http://a.example.com/", client=client, **kwargs
+            ) as source:
+                return await source.__anext__()
+
+    event = asyncio.run(run())
+    assert event.data == "a"
+    assert event.origin == "http://a.example.com"
+    with pytest.raises(InvalidStatusCodeError):
+        asyncio.run(run(follow_redirects=False))
@@ -1,9 +1,49 @@
 """Tests for `requests_sse` package."""
+import io
 import json
+import random
+import time
+from datetime import timedelta
+from typing import List
+
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+from requests.auth import AuthBase
+from urllib3 import HTTPResponse
 
 from requests_sse import EventSource
 
 
+class StreamAdapter(BaseAdapter):
+    """Transport adapter answering every request with the same event stream."""
+
+    def __init__(self, body: bytes):
+        super().__init__()
+        self.body = body
+        self.requests: List[requests.PreparedRequest] = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/event-stream"
+        response.raw = HTTPResponse(io.BytesIO(self.body), preload_content=False)
+        response.url = request.url
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+def stream_session(body: bytes):
+    session = requests.Session()
+    adapter = StreamAdapter(body)
+    session.mount("http://", adapter)
+    return session, adapter
+
+
 def test_basic_usage():
     """Test basic usage."""
     messages = []
@@ -23,3 +63,119 @@ def test_basic_usage():
     data_0 = json.loads(messages[0].data)
     data_1 = json.loads(messages[1].data)
     assert data_0["meta"]["id"] != data_1["meta"]["id"]
+
+
+def test_auth_per_connect():
+    """Test that authentication runs again when reconnecting."""
+
+    class TokenAuth(AuthBase):
+        calls = 0
+
+        def __call__(self, r):
+            self.calls += 1
+            r.headers["Authorization"] = f"tok{self.calls}"
+            return r
+
+    session, adapter = stream_session(b"id: 1\ndata: a\n\n")
+    with EventSource(
+        "http://example.com/",
+        reconnection_time=timedelta(0),
+        session=session,
+        auth=TokenAuth(),
+    ) as source:
+        events = [e for _, e in zip(range(2), source)]
+
+    assert [e.data for e in events] == ["a", "a"]
+    assert [r.headers["Authorization"] for r in adapter.requests] == ["tok1", "tok2"]
+    assert adapter.requests[1].headers["Last-Event-Id"] == "1"
+
+
+def test_session_per_connect():
+    """Test that changes to the session are used when reconnecting."""
+    session, adapter = stream_session(b"data: a\n\n")
+    session.headers["Authorization"] = "Bearer old"
+    with EventSource(
+        "http://example.com/", reconnection_time=timedelta(0), session=session
+    ) as source:
+        next(source)
+        session.headers["Authorization"] = "Bearer new"
+        session.params = {"since": "x"}
+        session.cookies.set("c", "1")
+        next(source)
+
+    assert [(r.headers["Authorization"], r.url) for r in adapter.requests] == [
+        ("Bearer old", "http://example.com/"),
+        ("Bearer new", "http://example.com/?since=x"),
+    ]
+    assert "Cookie" not in adapter.requests[0].headers
+    assert adapter.requests[1].headers["Cookie"] == "c=1"
+
+
+def test_reconnect_backoff(monkeypatch):
+    """Test that the back-off grows until data is received and is capped."""
+    waits = []
+    session, adapter = stream_session(b"")
+
+    def sleep(seconds):
+        waits.append(seconds)
+        if len(waits) == 4:
+            adapter.body = b"data: a\n\n"
+
+    monkeypatch.setattr(random, "random", lambda: 0.5)
+    monkeypatch.setattr(time, "sleep", sleep)
+    with EventSource(
+        "http://example.com/",
+        reconnection_time=timedelta(seconds=1),
+        max_reconnection_time=timedelta(seconds=5),
+        session=session,
+    ) as source:
+        next(source)
+        next(source)
+
+    # the empty responses keep doubling it, the event resets it
+    assert waits == [1, 2, 2.5, 2.5, 1]
+    assert len(adapter.requests) == 6
+
+
+def test_run_forever():
+    """Test that run_forever dispatches messages until closed from on_message."""
+    messages = []
+
+    def on_message(event):
+        messages.append(event.data)
+        if len(messages) == 3:
+            source.close()
+
+    session, adapter = stream_session(b"data: a\n\nevent: x\ndata: y\n\ndata: b\n\n")
+    with EventSource(
+        "http://example.com/",
+        reconnection_time=timedelta(0),
+        session=session,
+        on_message=on_message,
+    ) as source:
+        source.run_forever()
+
+    assert messages == ["a", "b", "a"]
+    assert len(adapter.requests) == 2
+
+
+def test_run_forever_callback_error():
+    """Test that errors raised by on_message are not taken for transport errors."""
+    messages = []
+
+    def on_message(event):
+        messages.append(event.data)
+        raise requests.ConnectionError("from on_message")
+
+    session, adapter = stream_session(b"data: a\n\ndata: b\n\n")
+    with EventSource(
+        "http://example.com/",
+        reconnection_time=timedelta(0),
+        session=session,
+        on_message=on_message,
+    ) as source:
+        with pytest.raises(requests.ConnectionError, match="from on_message"):
+            source.run_forever()
+
+    assert messages == ["a"]
+    assert len(adapter.requests) == 1
@@ -0,0 +1,143 @@
+"""Tests for the event stream parser, without any network access."""
+from typing import List
+
+import pytest
+
+from requests_sse import MessageEvent
+from requests_sse.client import _SSEParser
+
+
+def parse(*chunks: bytes, parser=None) -> List[MessageEvent]:
+    parser = parser or _SSEParser()
+    events = []
+    for chunk in chunks:
+        events.extend(parser.feed(chunk))
+    return events
+
+
+def test_feed():
+    """Test events, types, ids and comments."""
+    parser = _SSEParser()
+    parser.origin = "https://example.com"
+    events = parse(
+        b"data: a\n\n",
+        b": comment\nevent: add\ndata: b\n\n",
+        b"id: 1\ndata: c\n\n",
+        parser=parser,
+    )
+    assert events == [
+        MessageEvent(
+            type="message", data="a", origin="https://example.com", last_event_id=""
+        ),
+        MessageEvent(
+            type="add", data="b", origin="https://example.com", last_event_id=""
+        ),
+        MessageEvent(
+            type="message", data="c", origin="https://example.com", last_event_id="1"
+        ),
+    ]
+    assert parser.last_event_id == "1"
+
+
+def test_feed_data():
+    """Test multi-line and empty data."""
+    events = parse(b"data:msg\ndata: msg\n\ndata:\n\ndata\ndata\n\ndata:  end\n\n")
+    assert [e.data for e in events] == ["msg\nmsg", "", "\n", " end"]
+
+
+def test_feed_without_data():
+    """Test that a block without data dispatches nothing."""
+    parser = _SSEParser()
+    assert parse(b"event: add\nid: 2\n\n\n", parser=parser) == []
+    assert parser.last_event_id == "2"
+    assert parse(b"data: a\n\n", parser=parser)[0].type == "message"
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        (b"data: a\r\ndata: b\r\n\r\n",),
+        (b"data: a\rdata: b\r\r",),
+        (b"data: a\ndata: b\n\n",),
+        (b"data: a\r", b"\ndata: b\r", b"\r\n"),
+        (b"data: a\r", b"", b"\ndata: b\n\n"),
+        (b"da", b"ta: a\n", b"data: b", b"\n", b"\n"),
+    ],
+)
+def test_feed_line_terminators(chunks):
+    """Test CRLF, CR and LF line terminators, also split across chunks."""
+    assert [e.data for e in parse(*chunks)] == ["a\nb"]
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        (b"\xef\xbb\xbfdata: a\n\n",),
+        (b"\xef", b"\xbb", b"\xbfdata: a\n\n"),
+    ],
+)
+def test_feed_bom(chunks):
+    """Test that a leading BOM is removed."""
+    assert [e.data for e in parse(*chunks)] == ["a"]
+
+
+def test_feed_bom_once():
+    """Test that only the BOM at the start of the stream is removed."""
+    events = parse(b"\xef\xbb\xbfdata: a\n\n\xef\xbb\xbfdata: b\n\n")
+    assert [e.data for e in events] == ["a"]
+
+
+def test_feed_utf8():
+    """Test UTF-8 split across chunks and invalid UTF-8."""
+    events = parse(b"data: \xe2\x80", b"\xa6\n\ndata: \xff\n\n")
+    assert [e.data for e in events] == ["…", "�"]
+
+
+def test_feed_id_null():
+    """Test that an id containing U+0000 is ignored."""
+    events = parse(b"id: 1\ndata: a\n\nid: \x00\x00\ndata: b\n\nid: a\x00\ndata: c\n\n")
+    assert [e.last_event_id for e in events] == ["1", "1", "1"]
+
+
+def test_feed_retry():
+    """Test the retry field."""
+    parser = _SSEParser()
+    parse(b"retry: 1500\n\n", parser=parser)
+    assert parser.retry == 1.5
+    parse(b"retry: soon\n\n", parser=parser)
+    assert parser.retry == 1.5
+
+
+def test_reset():
+    """Test that reset drops the pending line and data but keeps the event id."""
+    parser = _SSEParser()
+    assert len(parse(b"id: 1\ndata: a\n\nid: 2\ndata: b\ndat", parser=parser)) == 1
+    parser.reset()
+    events = parse(b"a: c\n\n", b"data: d\n\n", parser=parser)
+    assert [(e.data, e.last_event_id) for e in events] == [("d", "2")]
+
+
+def test_push_line():
+    """Test pushing lines one by one."""
+    parser = _SSEParser()
+    assert parser.push_line(b"data: a") is None
+    assert parser.push_line(b"unknown: field") is None
+    event = parser.push_line(b"")
+    assert event is not None
+    assert event.data == "a"
+
+
+def test_feed_long_line():
+    """Test a line split across many chunks."""
+    data = b"x" * 100_000
+    chunks = [b"data: "] + [data[i : i + 1000] for i in range(0, len(data), 1000)]
+    assert [e.data for e in parse(*chunks, b"\r", b"\n\n")] == [data.decode()]
+
+
+def test_feed_returns_list():
+    """Test that feed parses the whole chunk at once."""
+    parser = _SSEParser()
+    events = parser.feed(b"data: a\n\ndata: b\n\ndata: c\n")
+    assert [e.data for e in events] == ["a", "b"]
+    assert parser.feed(b"data") == []
+    assert [e.data for e in parser.feed(b": d\n\n")] == ["c\nd"]
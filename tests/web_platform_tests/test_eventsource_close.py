@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+import time
+from datetime import timedelta
 
 from requests_sse import EventSource, InvalidStatusCodeError, ReadyState
 
@@ -42,9 +43,7 @@ def test_eventsource_close_reconnect():
             assert False
 
     with EventSource(
-        WPT_SERVER
-        + "resources/reconnect-fail.py?id="
-        + str(datetime.utcnow().timestamp()),
+        WPT_SERVER + "resources/reconnect-fail.py?id=" + format(time.time(), ".6f"),
         reconnection_time=timedelta(milliseconds=2),
         on_error=on_error,
     ) as source:
@@ -6,14 +6,22 @@ from requests_sse import EventSource, InvalidStatusCodeError, ReadyState
 
 from .const import WPT_SERVER
 
+REDIRECT_PREFIX = WPT_SERVER.replace(
+    "eventsource/",
+    "common/redirect.py?location=/eventsource/resources/message.py&status=",
+)
+STATUS_PREFIX = WPT_SERVER + "resources/status-error.py?status="
 
-def test_request_accept():
+
+def test_request_accept(session):
     """Test EventSource: Accept header.
 
     ..seealso: https://github.com/web-platform-tests/wpt/blob/master/
     eventsource/request-accept.htm
     """
-    source = EventSource(WPT_SERVER + "resources/accept.event_stream?pipe=sub")
+    source = EventSource(
+        WPT_SERVER + "resources/accept.event_stream?pipe=sub", session=session
+    )
     source.connect()
     for e in source:
         assert e.data == "text/event-stream"
@@ -21,13 +29,15 @@ def test_request_accept():
     source.close()
 
 
-def test_request_cache_control():
+def test_request_cache_control(session):
     """Test EventSource: Cache-Control.
 
     ..seealso: https://github.com/web-platform-tests/wpt/blob/master/
     eventsource/request-cache-control.htm
     """
-    source = EventSource(WPT_SERVER + "resources/cache-control.event_stream?pipe=sub")
+    source = EventSource(
+        WPT_SERVER + "resources/cache-control.event_stream?pipe=sub", session=session
+    )
     source.connect()
     for e in source:
         assert e.data == "no-cache"
@@ -37,73 +47,60 @@ def test_request_cache_control():
 
 # https://github.com/dask/distributed/issues/5607
 @pytest.mark.skipif(sys.version_info < (3, 8), reason="requires python3.8 or higher")
-def test_request_redirect():
+@pytest.mark.parametrize("status", [301, 302, 303, 307])
+def test_request_redirect(session, status):
     """Test EventSource: redirect.
 
     ..seealso: https://github.com/web-platform-tests/wpt/blob/master/
     eventsource/request-redirect.htm
     """
 
-    def test(status):
-        def on_error():
-            assert False
-
-        def on_open():
-            assert source.ready_state == ReadyState.OPEN
-
-        source = EventSource(
-            WPT_SERVER.replace(
-                "eventsource",
-                "common/redirect.py?"
-                "location=/eventsource/resources/message.py&status=" + str(status),
-            ),
-            on_open=on_open,
-            on_error=on_error,
-        )
-        source.connect()
-        source.close()
+    def on_error():
+        assert False
 
-    test(301)
-    test(302)
-    test(303)
-    test(307)
+    def on_open():
+        assert source.ready_state == ReadyState.OPEN
 
+    source = EventSource(
+        f"{REDIRECT_PREFIX}{status}",
+        on_open=on_open,
+        on_error=on_error,
+        session=session,
+    )
+    source.connect()
+    source.close()
 
-def test_request_status_error():
+
+@pytest.mark.parametrize("status", [204, 205, 210, 299, 404, 410, 503])
+def test_request_status_error(session, status):
     """Test EventSource: redirect.
 
     ..seealso: https://github.com/web-platform-tests/wpt/blob/master/
     eventsource/request-status-error.htm
     """
 
-    def test(status):
-        def on_error():
-            assert source.ready_state == ReadyState.CLOSED
-
-        def on_message():
-            assert source.ready_state == ReadyState.OPEN
+    def on_error():
+        assert source.ready_state == ReadyState.CLOSED
 
-        source = EventSource(
-            WPT_SERVER + "resources/status-error.py?status=" + str(status),
-            on_message=on_message,
-            on_error=on_error,
-        )
-        with pytest.raises(InvalidStatusCodeError) as e:
-            source.connect()
-        assert e.value.status_code == status
+    def on_message():
+        assert source.ready_state == ReadyState.OPEN
 
-    test(204)
-    test(205)
-    test(210)
-    test(299)
-    test(404)
-    test(410)
-    test(503)
+    source = EventSource(
+        f"{STATUS_PREFIX}{status}",
+        on_message=on_message,
+        on_error=on_error,
+        session=session,
+    )
+    with pytest.raises(InvalidStatusCodeError) as e:
+        source.connect()
+    assert e.value.status_code == status
 
 
-def test_request_post_to_connect():
+def test_request_post_to_connect(session):
     """Test EventSource post method for connection."""
-    source = EventSource(WPT_SERVER + "resources/message.py", method="POST")
+    source = EventSource(
+        WPT_SERVER + "resources/message.py", method="POST", session=session
+    )
     source.connect()
     for e in source:
         assert e.data == "data"